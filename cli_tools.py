@@ -1,24 +1,30 @@
 import argparse
+import asyncio
 import logging
 import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from main import LectureProcessor
-from transcription.audio_extractor import AudioExtractor
-from transcription.text_processor import TextProcessor
-from transcription.transcriber import Transcriber
-from transcription.typst_generator import TypstGenerator
+# Pipeline classes are imported inside each command so a single command only
+# loads the dependencies it needs (openai, nltk, pywhispercpp).
+from transcription.transcriber import BACKENDS, QUANTIZATIONS
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Videos whose audio is extracted ahead of the one being transcribed.
+PREFETCH_AHEAD = 2
+
 
 def extract_audio_cli(args):
+    from transcription.audio_extractor import AudioExtractor
+
     extractor = AudioExtractor()
     output = args.output or f"{Path(args.video_path).stem}_audio.wav"
     extractor.extract_audio(args.video_path, output, args.sample_rate)
@@ -26,12 +32,54 @@ def extract_audio_cli(args):
 
 
 def transcribe_audio_cli(args):
+    from transcription.transcriber import Transcriber
+
+    model_params = {}
+    if args.backend == "faster-whisper":
+        model_params = {
+            "cpu_threads": args.cpu_threads,
+            "num_workers": args.num_workers,
+        }
+        # These options may come from the environment, so drop them with a
+        # warning instead of failing.
+        for flag in ("quantization", "processors", "threads"):
+            dest = f"whisper_cpp_{flag}"
+            if getattr(args, dest):
+                logger.warning(
+                    f"--whisper-cpp-{flag} is ignored with --backend faster-whisper"
+                )
+                setattr(args, dest, None)
+    else:
+        faster_whisper_only = {
+            "compute-type": args.compute_type is not None,
+            "cpu-threads": args.cpu_threads != 0,
+            "num-workers": args.num_workers != 1,
+        }
+        for flag, is_set in faster_whisper_only.items():
+            if is_set:
+                logger.warning(f"--{flag} is ignored unless --backend faster-whisper")
+        args.compute_type = None
+
     transcriber = Transcriber(
         model_path=args.whisper_cpp_model,
         models_dir=args.whisper_cpp_models_dir,
+        n_processors=args.whisper_cpp_processors,
+        n_threads=args.whisper_cpp_threads,
+        quantization=args.whisper_cpp_quantization,
+        backend=args.backend,
+        openvino_device=args.openvino_device,
+        vad_filter=args.vad_filter,
+        vad_min_silence_ms=args.vad_min_silence_ms,
+        compute_type=args.compute_type,
+        **model_params,
     )
     output = args.output or f"{Path(args.audio_path).stem}.srt"
-    transcriber.transcribe_to_srt(args.audio_path, output, language=args.language)
+    if args.batch_size:
+        transcriber.transcribe_to_srt_batched(
+            args.audio_path, output, language=args.language, batch_size=args.batch_size
+        )
+    else:
+        transcriber.transcribe_to_srt(args.audio_path, output, language=args.language)
 
     if args.text_only:
         print(transcriber.extract_text_from_srt(output))
@@ -40,15 +88,15 @@ def transcribe_audio_cli(args):
 
 
 def process_text_cli(args):
+    from transcription.text_processor import TextProcessor
+    from transcription.transcriber import Transcriber
+
     processor = TextProcessor()
     source_path = Path(args.input_path)
 
     if source_path.suffix.lower() == ".srt":
-        transcriber = Transcriber(
-            model_path=args.whisper_cpp_model,
-            models_dir=args.whisper_cpp_models_dir,
-        )
-        raw_text = transcriber.extract_text_from_srt(str(source_path))
+        # SRT parsing needs no whisper.cpp model, so none is loaded here.
+        raw_text = Transcriber.extract_text_from_srt(str(source_path))
     else:
         raw_text = source_path.read_text(encoding="utf-8")
 
@@ -61,6 +109,8 @@ def process_text_cli(args):
 
 
 def generate_typst_cli(args):
+    from transcription.typst_generator import TypstGenerator
+
     load_dotenv()
     api_key = args.api_key or os.getenv("DEEPSEEK_API_KEY")
 
@@ -72,7 +122,122 @@ def generate_typst_cli(args):
     print(f"Typst notes generated: {output}")
 
 
+# LectureProcessor owned by a pool worker, built once by _init_worker.
+_worker_processor = None
+
+
+def _processor_kwargs(args, api_key):
+    """LectureProcessor arguments shared by batch-process and serve."""
+    return {
+        "api_key": api_key,
+        "whisper_cpp_model": args.whisper_cpp_model,
+        "whisper_cpp_models_dir": args.whisper_cpp_models_dir,
+        "llm_model": args.model,
+        "whisper_cpp_processors": args.whisper_cpp_processors,
+        "whisper_cpp_threads": args.whisper_cpp_threads,
+        "whisper_cpp_quantization": args.whisper_cpp_quantization,
+        "vad_filter": args.vad_filter,
+        "vad_min_silence_ms": args.vad_min_silence_ms,
+        "cache_dir": _cache_dir(args),
+    }
+
+
+def _cache_dir(args):
+    return None if args.no_cache else Path(args.output) / ".cache"
+
+
+def _init_worker(processor_kwargs):
+    """Load models once per worker process.
+
+    The whisper.cpp model cannot be pickled, so each worker builds its own
+    LectureProcessor and keeps it for every video it is handed.
+    """
+    from main import LectureProcessor
+
+    global _worker_processor
+    _worker_processor = LectureProcessor(**processor_kwargs)
+
+
+def _prepare_one(video_path, output_dir, keep_intermediates, language, max_sentences):
+    """Run the local pipeline steps for one video inside a worker process."""
+    return _worker_processor.prepare_lecture(
+        video_path,
+        output_dir=output_dir,
+        keep_intermediates=keep_intermediates,
+        language=language,
+        max_sentences=max_sentences,
+    )
+
+
+def _create_executor(args, api_key):
+    """Create the worker pool used for parallel batch processing."""
+    initargs = (_processor_kwargs(args, api_key),)
+    if args.mpi:
+        try:
+            from mpi4py.futures import MPIPoolExecutor
+        except ImportError:
+            raise RuntimeError(
+                "mpi4py is not installed. Install it to use --mpi, "
+                "e.g. `uv pip install mpi4py`."
+            )
+        return MPIPoolExecutor(
+            max_workers=args.jobs, initializer=_init_worker, initargs=initargs
+        )
+
+    return ProcessPoolExecutor(
+        max_workers=args.jobs, initializer=_init_worker, initargs=initargs
+    )
+
+
+def _extract_unless_cached(processor, file, output_dir, language):
+    if processor.has_cached_transcript(str(file), language):
+        return None
+    return processor.extract_lecture_audio(str(file), str(output_dir))
+
+
+def _prefetch_audio(processor, files, output_dir, language):
+    """Yield (file, audio future) pairs while extracting a few videos ahead.
+
+    ffmpeg runs in background threads, so extraction of the next videos
+    overlaps transcription of the current one. At most PREFETCH_AHEAD
+    extractions are in flight, which bounds both the ffmpeg processes
+    competing with whisper.cpp and the WAV files waiting on disk. Videos with
+    a cached transcript are not extracted; their future resolves to None.
+    """
+    with ThreadPoolExecutor(max_workers=PREFETCH_AHEAD) as pool:
+        pending = deque()
+        for file in files:
+            future = pool.submit(
+                _extract_unless_cached, processor, file, output_dir, language
+            )
+            pending.append((file, future))
+            if len(pending) > PREFETCH_AHEAD:
+                yield pending.popleft()
+
+        while pending:
+            yield pending.popleft()
+
+
+async def _generate_all(generator, lectures, concurrency):
+    """Generate notes for prepared lectures, `concurrency` LLM calls at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def generate(lecture):
+        async with semaphore:
+            await generator.agenerate_notes(
+                lecture["llm_text"], lecture["typst_path"], title=lecture["title"]
+            )
+        return lecture["typst_path"]
+
+    return await asyncio.gather(
+        *(generate(lecture) for _, lecture in lectures), return_exceptions=True
+    )
+
+
 def batch_process_cli(args):
+    from main import LectureProcessor
+    from transcription.typst_generator import TypstGenerator
+
     load_dotenv()
     api_key = os.getenv("DEEPSEEK_API_KEY")
 
@@ -85,29 +250,99 @@ def batch_process_cli(args):
         print(f"No MP4 files found in: {input_dir}")
         return
 
-    processor = LectureProcessor(
-        api_key=api_key,
-        whisper_cpp_model=args.whisper_cpp_model,
-        whisper_cpp_models_dir=args.whisper_cpp_models_dir,
-        llm_model=args.model,
+    # Run the local steps for every video first, then overlap the LLM calls.
+    lectures = []
+    if not args.mpi and (args.jobs or 1) == 1:
+        processor = LectureProcessor(**_processor_kwargs(args, api_key))
+
+        for file, audio_future in _prefetch_audio(
+            processor, files, output_dir, args.language
+        ):
+            try:
+                lecture = processor.prepare_lecture(
+                    str(file),
+                    output_dir=str(output_dir),
+                    keep_intermediates=args.keep_intermediates,
+                    language=args.language,
+                    max_sentences=args.max_sentences,
+                    audio_path=audio_future.result(),
+                )
+                lectures.append((file, lecture))
+            except Exception as exc:
+                logger.error(f"Failed for {file.name}: {exc}")
+    else:
+        # Videos share no state, so each worker runs the local steps on its own.
+        with _create_executor(args, api_key) as executor:
+            futures = {
+                executor.submit(
+                    _prepare_one,
+                    str(file),
+                    str(output_dir),
+                    args.keep_intermediates,
+                    args.language,
+                    args.max_sentences,
+                ): file
+                for file in files
+            }
+            for future in as_completed(futures):
+                file = futures[future]
+                try:
+                    lectures.append((file, future.result()))
+                except Exception as exc:
+                    logger.error(f"Failed for {file.name}: {exc}")
+
+    generator = TypstGenerator(
+        api_key=api_key, model=args.model, cache_dir=_cache_dir(args)
     )
+    results = asyncio.run(_generate_all(generator, lectures, args.llm_concurrency))
 
     success = 0
-    for file in files:
+    for (file, _), result in zip(lectures, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed for {file.name}: {result}")
+        else:
+            print(f"Done: {result}")
+            success += 1
+
+    print(f"Batch completed: {success}/{len(files)} succeeded")
+
+
+def serve_cli(args):
+    """Keep models loaded and process video paths read line by line from stdin."""
+    from main import LectureProcessor
+
+    load_dotenv()
+    api_key = os.getenv("DEEPSEEK_API_KEY")
+
+    processor = LectureProcessor(**_processor_kwargs(args, api_key))
+    if args.warmup:
+        processor.transcriber.warmup()
+    logger.info("Lecture server ready, reading video paths from stdin")
+
+    for line in sys.stdin:
+        video_path = line.strip()
+        if not video_path:
+            continue
+
         try:
             result = processor.process_lecture(
-                str(file),
-                output_dir=str(output_dir),
+                video_path,
+                output_dir=args.output,
                 keep_intermediates=args.keep_intermediates,
                 language=args.language,
                 max_sentences=args.max_sentences,
             )
-            print(f"Done: {result}")
-            success += 1
+            print(f"Done: {result}", flush=True)
         except Exception as exc:
-            logger.error(f"Failed for {file.name}: {exc}")
+            logger.error(f"Failed for {video_path}: {exc}")
 
-    print(f"Batch completed: {success}/{len(files)} succeeded")
+
+def _positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def build_parser():
@@ -132,6 +367,57 @@ def build_parser():
     p_transcribe.add_argument(
         "--whisper-cpp-models-dir", default=os.getenv("WHISPER_CPP_MODELS_DIR")
     )
+    p_transcribe.add_argument(
+        "--whisper-cpp-processors",
+        type=int,
+        help="Split each audio into N chunks decoded in parallel by whisper.cpp",
+    )
+    p_transcribe.add_argument(
+        "--whisper-cpp-threads",
+        type=int,
+        help="Threads whisper.cpp uses for feature extraction and inference",
+    )
+    p_transcribe.add_argument(
+        "--whisper-cpp-quantization",
+        choices=QUANTIZATIONS,
+        default=os.getenv("WHISPER_CPP_QUANTIZATION"),
+    )
+    p_transcribe.add_argument(
+        "--vad-filter",
+        action="store_true",
+        help="Skip silent stretches so whisper.cpp only transcribes speech",
+    )
+    p_transcribe.add_argument(
+        "--vad-min-silence-ms",
+        type=int,
+        default=500,
+        help="Shortest pause --vad-filter removes, in milliseconds",
+    )
+    p_transcribe.add_argument("--backend", choices=BACKENDS, default="whispercpp")
+    p_transcribe.add_argument(
+        "--openvino-device", default="CPU", help="Device for --backend openvino"
+    )
+    p_transcribe.add_argument(
+        "--compute-type",
+        help="CTranslate2 compute type for --backend faster-whisper (default: auto)",
+    )
+    p_transcribe.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=0,
+        help="CPU threads for --backend faster-whisper (0 uses the default)",
+    )
+    p_transcribe.add_argument(
+        "--num-workers",
+        type=int,
+        default=1,
+        help="Concurrent transcriptions one faster-whisper model can serve",
+    )
+    p_transcribe.add_argument(
+        "--batch-size",
+        type=int,
+        help="Decode VAD chunks in batches of N (--backend faster-whisper)",
+    )
     p_transcribe.add_argument("-o", "--output")
     p_transcribe.add_argument("--language")
     p_transcribe.add_argument("--text-only", action="store_true")
@@ -174,12 +460,112 @@ def build_parser():
     p_batch.add_argument(
         "--whisper-cpp-models-dir", default=os.getenv("WHISPER_CPP_MODELS_DIR")
     )
+    p_batch.add_argument(
+        "--whisper-cpp-processors",
+        type=int,
+        help="Split each audio into N chunks decoded in parallel by whisper.cpp",
+    )
+    p_batch.add_argument(
+        "--whisper-cpp-threads",
+        type=int,
+        help="Threads whisper.cpp uses for feature extraction and inference",
+    )
+    p_batch.add_argument(
+        "--whisper-cpp-quantization",
+        choices=QUANTIZATIONS,
+        default=os.getenv("WHISPER_CPP_QUANTIZATION"),
+    )
+    p_batch.add_argument(
+        "--vad-filter",
+        action="store_true",
+        help="Skip silent stretches so whisper.cpp only transcribes speech",
+    )
+    p_batch.add_argument(
+        "--vad-min-silence-ms",
+        type=int,
+        default=500,
+        help="Shortest pause --vad-filter removes, in milliseconds",
+    )
     p_batch.add_argument("--model", default="deepseek-reasoner")
     p_batch.add_argument("--language")
     p_batch.add_argument("--max-sentences", type=int, default=120)
     p_batch.add_argument("--keep-intermediates", action="store_true")
+    p_batch.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not write the transcript/notes cache in <output>/.cache",
+    )
+    p_batch.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of videos processed in parallel (default: 1, or all MPI workers with --mpi)",
+    )
+    p_batch.add_argument(
+        "--mpi",
+        action="store_true",
+        help="Distribute videos over MPI ranks with mpi4py instead of local processes",
+    )
+    p_batch.add_argument(
+        "--llm-concurrency",
+        type=_positive_int,
+        default=4,
+        help="Maximum number of note generation requests in flight (default: 4)",
+    )
     p_batch.set_defaults(func=batch_process_cli)
 
+    p_serve = subparsers.add_parser(
+        "serve", help="Keep models loaded and process MP4 paths read from stdin"
+    )
+    p_serve.add_argument("--output", default="output")
+    p_serve.add_argument(
+        "--whisper-cpp-model", default=os.getenv("WHISPER_CPP_MODEL", "base.en")
+    )
+    p_serve.add_argument(
+        "--whisper-cpp-models-dir", default=os.getenv("WHISPER_CPP_MODELS_DIR")
+    )
+    p_serve.add_argument(
+        "--whisper-cpp-processors",
+        type=int,
+        help="Split each audio into N chunks decoded in parallel by whisper.cpp",
+    )
+    p_serve.add_argument(
+        "--whisper-cpp-threads",
+        type=int,
+        help="Threads whisper.cpp uses for feature extraction and inference",
+    )
+    p_serve.add_argument(
+        "--whisper-cpp-quantization",
+        choices=QUANTIZATIONS,
+        default=os.getenv("WHISPER_CPP_QUANTIZATION"),
+    )
+    p_serve.add_argument(
+        "--vad-filter",
+        action="store_true",
+        help="Skip silent stretches so whisper.cpp only transcribes speech",
+    )
+    p_serve.add_argument(
+        "--vad-min-silence-ms",
+        type=int,
+        default=500,
+        help="Shortest pause --vad-filter removes, in milliseconds",
+    )
+    p_serve.add_argument("--model", default="deepseek-reasoner")
+    p_serve.add_argument("--language")
+    p_serve.add_argument("--max-sentences", type=int, default=120)
+    p_serve.add_argument("--keep-intermediates", action="store_true")
+    p_serve.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Run a silent clip through the model before reading stdin",
+    )
+    p_serve.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not write the transcript/notes cache in <output>/.cache",
+    )
+    p_serve.set_defaults(func=serve_cli)
+
     return parser
 
 
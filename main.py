@@ -1,4 +1,6 @@
 import argparse
+import functools
+import hashlib
 import logging
 import os
 import sys
@@ -7,8 +9,9 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from transcription.audio_extractor import AudioExtractor
+from transcription.cache import write_cache_file
 from transcription.text_processor import TextProcessor
-from transcription.transcriber import Transcriber
+from transcription.transcriber import QUANTIZATIONS, Transcriber
 from transcription.typst_generator import TypstGenerator
 
 # Setup logging
@@ -18,6 +21,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _file_digest(path, size, mtime_ns):
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _content_hash(path):
+    """SHA-256 of a file, memoized while its size and mtime are unchanged."""
+    stat = os.stat(path)
+    return _file_digest(str(path), stat.st_size, stat.st_mtime_ns)
+
+
 class LectureProcessor:
     def __init__(
         self,
@@ -25,18 +40,53 @@ class LectureProcessor:
         whisper_cpp_model="base.en",
         whisper_cpp_models_dir=None,
         llm_model="deepseek-reasoner",
+        whisper_cpp_processors=None,
+        whisper_cpp_threads=None,
+        whisper_cpp_quantization=None,
+        vad_filter=False,
+        vad_min_silence_ms=500,
+        cache_dir=None,
     ):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.audio_extractor = AudioExtractor()
         self.transcriber = Transcriber(
             model_path=whisper_cpp_model,
             models_dir=whisper_cpp_models_dir,
+            n_processors=whisper_cpp_processors,
+            n_threads=whisper_cpp_threads,
+            quantization=whisper_cpp_quantization,
+            vad_filter=vad_filter,
+            vad_min_silence_ms=vad_min_silence_ms,
         )
         self.text_processor = TextProcessor()
         self.typst_generator = TypstGenerator(
             api_key=api_key,
             model=llm_model,
+            cache_dir=cache_dir,
         )
 
+    def extract_lecture_audio(self, video_path, output_dir="output"):
+        """
+        Run Step 1 of the pipeline on its own.
+
+        Batch runs call this ahead of time so ffmpeg for the next video overlaps
+        transcription of the current one.
+
+        Args:
+            video_path (str): Path to the input video file
+            output_dir (str): Directory to save the extracted audio
+
+        Returns:
+            str: Path to the extracted WAV file
+        """
+        video_path = self._validate_video(video_path)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(exist_ok=True)
+
+        audio_path = output_dir / f"{video_path.stem}_audio.wav"
+        self.audio_extractor.extract_audio(str(video_path), str(audio_path))
+        return str(audio_path)
+
     def process_lecture(
         self,
         video_path,
@@ -44,6 +94,7 @@ class LectureProcessor:
         keep_intermediates=False,
         language=None,
         max_sentences=120,
+        audio_path=None,
     ):
         """
         Complete pipeline to process an MP4 lecture into Typst notes.
@@ -53,37 +104,81 @@ class LectureProcessor:
             output_dir (str): Directory to save output files
             keep_intermediates (bool): Whether to keep intermediate files
             language (str): Language code for transcription (e.g., 'en', 'es')
+            audio_path (str): Audio already extracted by extract_lecture_audio;
+                Step 1 is skipped when given
 
         Returns:
             str: Path to the generated Typst file
         """
-        video_path = Path(video_path)
+        lecture = self.prepare_lecture(
+            video_path,
+            output_dir=output_dir,
+            keep_intermediates=keep_intermediates,
+            language=language,
+            max_sentences=max_sentences,
+            audio_path=audio_path,
+        )
+
+        # Step 4: Generate Typst notes
+        logger.info("Step 4: Generating Typst notes with LLM...")
+        self.typst_generator.generate_notes(
+            lecture["llm_text"],
+            lecture["typst_path"],
+            title=lecture["title"],
+        )
+
+        logger.info(
+            f"Processing complete! Typst notes saved to: {lecture['typst_path']}"
+        )
+        return lecture["typst_path"]
+
+    def prepare_lecture(
+        self,
+        video_path,
+        output_dir="output",
+        keep_intermediates=False,
+        language=None,
+        max_sentences=120,
+        audio_path=None,
+    ):
+        """
+        Run the local Steps 1-3 of the pipeline, stopping before the LLM call.
+
+        Batch runs use this to finish all local work first and then generate
+        notes for every lecture concurrently. With a cache_dir, a video that
+        was already transcribed with the same settings skips Steps 1-3.
+
+        Args:
+            video_path (str): Path to the input video file
+            output_dir (str): Directory to save output files
+            keep_intermediates (bool): Whether to keep intermediate files
+            language (str): Language code for transcription (e.g., 'en', 'es')
+            audio_path (str): Audio already extracted by extract_lecture_audio;
+                Step 1 is skipped when given. Otherwise the audio is decoded
+                in memory and only written to disk with keep_intermediates
+
+        Returns:
+            dict: LLM input text, target Typst path and note title
+        """
+        video_path = self._validate_video(video_path)
         output_dir = Path(output_dir)
         output_dir.mkdir(exist_ok=True)
 
-        if not video_path.exists():
-            raise FileNotFoundError(f"Video file not found: {video_path}")
-        if video_path.suffix.lower() != ".mp4":
-            raise ValueError("Input must be an MP4 file.")
-
         logger.info(f"Processing lecture: {video_path.name}")
 
-        # Step 1: Extract audio
-        logger.info("Step 1: Extracting audio from video...")
-        audio_path = output_dir / f"{video_path.stem}_audio.wav"
-        self.audio_extractor.extract_audio(str(video_path), str(audio_path))
-
-        # Step 2: Transcribe audio to subtitles
-        logger.info("Step 2: Transcribing audio to subtitles using whisper.cpp...")
-        srt_path = output_dir / f"{video_path.stem}_subtitles.srt"
-        self.transcriber.transcribe_to_srt(
-            str(audio_path), str(srt_path), language=language
-        )
+        cache_path = self._transcript_cache_path(video_path, language)
+        if cache_path is not None and cache_path.exists():
+            logger.info("Steps 1-3: Reusing cached transcript...")
+            processed_text = cache_path.read_text(encoding="utf-8")
+            if audio_path is not None and not keep_intermediates:
+                Path(audio_path).unlink(missing_ok=True)
+        else:
+            processed_text = self._transcribe_lecture(
+                video_path, output_dir, keep_intermediates, language, audio_path
+            )
+            if cache_path is not None:
+                write_cache_file(cache_path, processed_text)
 
-        # Step 3: Extract and process text
-        logger.info("Step 3: Processing transcript text...")
-        raw_text = self.transcriber.extract_text_from_srt(str(srt_path))
-        processed_text = self.text_processor.process_text(raw_text)
         llm_text = self.text_processor.reduce_for_llm(
             processed_text, max_sentences=max_sentences
         )
@@ -97,24 +192,80 @@ class LectureProcessor:
         with open(reduced_path, "w", encoding="utf-8") as f:
             f.write(llm_text)
 
-        # Step 4: Generate Typst notes
-        logger.info("Step 4: Generating Typst notes with LLM...")
-        typst_path = output_dir / f"{video_path.stem}_notes.typ"
-        self.typst_generator.generate_notes(
-            llm_text,
-            str(typst_path),
-            title=f"Lecture Notes: {video_path.stem}",
+        return {
+            "llm_text": llm_text,
+            "typst_path": str(output_dir / f"{video_path.stem}_notes.typ"),
+            "title": f"Lecture Notes: {video_path.stem}",
+        }
+
+    def has_cached_transcript(self, video_path, language=None):
+        """Whether prepare_lecture can skip extraction and transcription."""
+        cache_path = self._transcript_cache_path(video_path, language)
+        return cache_path is not None and cache_path.exists()
+
+    def _transcript_cache_path(self, video_path, language):
+        """
+        Cache file for a processed transcript, keyed by the video contents and
+        the transcription settings. None when caching is disabled.
+        """
+        if self.cache_dir is None:
+            return None
+
+        settings = "|".join(
+            (
+                _content_hash(video_path),
+                str(self.transcriber.model_path),
+                str(self.transcriber.n_processors),
+                str(language),
+                str(self.transcriber.vad_filter),
+                str(self.transcriber.vad_min_silence_ms),
+            )
         )
+        key = hashlib.sha256(settings.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.processed.txt"
+
+    def _transcribe_lecture(
+        self, video_path, output_dir, keep_intermediates, language, audio_path
+    ):
+        """Run Steps 1-3 and return the processed transcript text."""
+        # Step 1: Extract audio
+        if audio_path is not None:
+            audio = str(audio_path)
+        elif keep_intermediates:
+            logger.info("Step 1: Extracting audio from video...")
+            audio_path = self.extract_lecture_audio(str(video_path), str(output_dir))
+            audio = audio_path
+        else:
+            # Hand the samples to whisper.cpp directly; no WAV round trip.
+            logger.info("Step 1: Extracting audio from video...")
+            audio = self.audio_extractor.extract_to_array(str(video_path))
+
+        # Step 2: Transcribe audio to subtitles
+        logger.info("Step 2: Transcribing audio to subtitles using whisper.cpp...")
+        srt_path = output_dir / f"{video_path.stem}_subtitles.srt"
+        self.transcriber.transcribe_to_srt(audio, str(srt_path), language=language)
+
+        # Step 3: Extract and process text
+        logger.info("Step 3: Processing transcript text...")
+        raw_text = self.transcriber.extract_text_from_srt(str(srt_path))
+        processed_text = self.text_processor.process_text(raw_text)
 
         # Cleanup intermediate files if requested
         if not keep_intermediates:
-            if audio_path.exists():
-                audio_path.unlink()
+            if audio_path is not None and Path(audio_path).exists():
+                Path(audio_path).unlink()
             if srt_path.exists():
                 srt_path.unlink()
 
-        logger.info(f"Processing complete! Typst notes saved to: {typst_path}")
-        return str(typst_path)
+        return processed_text
+
+    def _validate_video(self, video_path):
+        video_path = Path(video_path)
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        if video_path.suffix.lower() != ".mp4":
+            raise ValueError("Input must be an MP4 file.")
+        return video_path
 
 
 def main():
@@ -145,6 +296,33 @@ def main():
         default=os.getenv("WHISPER_CPP_MODELS_DIR"),
         help="Optional model download/cache directory for pywhispercpp",
     )
+    parser.add_argument(
+        "--whisper-cpp-processors",
+        type=int,
+        help="Split the audio into N chunks decoded in parallel by whisper.cpp",
+    )
+    parser.add_argument(
+        "--whisper-cpp-threads",
+        type=int,
+        help="Threads whisper.cpp uses for feature extraction and inference",
+    )
+    parser.add_argument(
+        "--whisper-cpp-quantization",
+        choices=QUANTIZATIONS,
+        default=os.getenv("WHISPER_CPP_QUANTIZATION"),
+        help="Use quantized model weights for faster, lighter inference (or set WHISPER_CPP_QUANTIZATION)",
+    )
+    parser.add_argument(
+        "--vad-filter",
+        action="store_true",
+        help="Skip silent stretches so whisper.cpp only transcribes speech",
+    )
+    parser.add_argument(
+        "--vad-min-silence-ms",
+        type=int,
+        default=500,
+        help="Shortest pause --vad-filter removes, in milliseconds",
+    )
     parser.add_argument(
         "--language", help="Language code for transcription (e.g., 'en', 'es')"
     )
@@ -154,6 +332,11 @@ def main():
         default=120,
         help="Maximum informative sentences retained for LLM input",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not write the transcript/notes cache in <output>/.cache",
+    )
     parser.add_argument(
         "--llm-model",
         default="deepseek-reasoner",
@@ -175,6 +358,12 @@ def main():
             whisper_cpp_model=args.whisper_cpp_model,
             whisper_cpp_models_dir=args.whisper_cpp_models_dir,
             llm_model=args.llm_model,
+            whisper_cpp_processors=args.whisper_cpp_processors,
+            whisper_cpp_threads=args.whisper_cpp_threads,
+            whisper_cpp_quantization=args.whisper_cpp_quantization,
+            vad_filter=args.vad_filter,
+            vad_min_silence_ms=args.vad_min_silence_ms,
+            cache_dir=None if args.no_cache else Path(args.output) / ".cache",
         )
         typst_file = processor.process_lecture(
             args.video_path,
@@ -4,6 +4,14 @@ import subprocess
 
 logger = logging.getLogger(__name__)
 
+# Set once ffmpeg has been found, so later extractors skip the probe.
+_FFMPEG_CHECKED = False
+
+# Quiet ffmpeg invocation shared by all extraction commands. No -threads:
+# with -vn only the audio stream is decoded, which ffmpeg does on one thread,
+# so batch runs can extract ahead without crowding out whisper.cpp.
+_FFMPEG_CMD = ["ffmpeg", "-hide_banner", "-nostats", "-loglevel", "error"]
+
 
 class AudioExtractor:
     def __init__(self):
@@ -11,13 +19,23 @@ class AudioExtractor:
 
     def _check_ffmpeg(self):
         """Check if ffmpeg is available"""
+        global _FFMPEG_CHECKED
+        if _FFMPEG_CHECKED:
+            return
+
         try:
-            subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
+            subprocess.run(
+                ["ffmpeg", "-version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
         except (subprocess.CalledProcessError, FileNotFoundError):
             raise RuntimeError(
                 "ffmpeg is not installed or not in PATH. "
                 "Please install ffmpeg to use this tool."
             )
+        _FFMPEG_CHECKED = True
 
     def extract_audio(self, video_path, audio_path, sample_rate=16000):
         """
@@ -33,7 +51,7 @@ class AudioExtractor:
 
         # ffmpeg command to extract audio
         cmd = [
-            "ffmpeg",
+            *_FFMPEG_CMD,
             "-i",
             video_path,  # Input video
             "-vn",  # Disable video
@@ -50,8 +68,62 @@ class AudioExtractor:
         logger.info(f"Extracting audio: {video_path} -> {audio_path}")
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Only stderr is piped; run() drains it while ffmpeg works.
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
             logger.info("Audio extraction completed successfully")
         except subprocess.CalledProcessError as e:
             logger.error(f"ffmpeg error: {e.stderr}")
             raise RuntimeError(f"Failed to extract audio: {e.stderr}")
+
+    def extract_to_array(self, video_path, sample_rate=16000, duration=None):
+        """
+        Decode the audio track straight into memory, without writing a WAV file
+
+        Args:
+            video_path (str): Path to input video file
+            sample_rate (int): Audio sample rate (default: 16000 for speech)
+            duration (float | None): Only decode this many seconds from the start
+
+        Returns:
+            np.ndarray: Mono float32 samples in [-1, 1], as whisper.cpp expects
+        """
+        import numpy as np
+
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        cmd = [
+            *_FFMPEG_CMD,
+            "-i",
+            video_path,  # Input video
+            "-vn",  # Disable video
+            "-f",
+            "f32le",  # Raw float32 samples
+            "-acodec",
+            "pcm_f32le",
+            "-ar",
+            str(sample_rate),  # Sample rate
+            "-ac",
+            "1",  # Mono channel
+        ]
+        if duration:
+            cmd += ["-t", str(duration)]  # Stop decoding early
+        cmd.append("pipe:1")  # Write to stdout
+
+        logger.info(f"Extracting audio into memory: {video_path}")
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace")
+            logger.error(f"ffmpeg error: {stderr}")
+            raise RuntimeError(f"Failed to extract audio: {stderr}")
+
+        logger.info("Audio extraction completed successfully")
+        return np.frombuffer(result.stdout, dtype=np.float32)
@@ -0,0 +1,44 @@
+import contextlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def write_cache_file(path, text):
+    """
+    Write a cache entry atomically, on a best-effort basis.
+
+    The text goes to a temporary file in the same directory, which then
+    replaces `path`, so an interrupted run never leaves a truncated entry
+    behind to be served on the next run. A failed write (disk full, cache
+    dir not writable) only logs a warning: the result being cached has
+    already been produced and must not be lost over it.
+
+    Args:
+        path (str | Path): Cache file to write
+        text (str): Entry contents
+
+    Returns:
+        bool: Whether the entry was written
+    """
+    path = Path(path)
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not write cache entry {path}: {e}")
+        return False
+    finally:
+        if tmp_path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
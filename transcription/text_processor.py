@@ -1,20 +1,41 @@
 import logging
 import re
-import string
-
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import sent_tokenize, word_tokenize
 
 logger = logging.getLogger(__name__)
 
+# Transcripts shorter than this (a title card, a few seconds of audio) are
+# only cleaned; sentence splitting and paragraphing are skipped.
+_SHORT_TEXT_CHARS = 200
+
+# Patterns are compiled once; filler and transition words are fused into a
+# single alternation so each text is scanned in one pass.
+_WHITESPACE_RE = re.compile(r"\s+")
+_REPEATED_CHAR_RE = re.compile(r"\b(\w)\1{2,}\b")
+_SINGLE_LETTER_RE = re.compile(r"\b[a-zA-Z]\b")
+_REPEATED_COMMA_RE = re.compile(r"[,]{2,}")
+_REPEATED_PERIOD_RE = re.compile(r"[.]{2,}")
+_FILLER_RE = re.compile(
+    r"\b(?:so um|okay so|alright so|you know|I mean|basically|actually|um|uh|ah|er)\b",
+    re.IGNORECASE,
+)
+_WORD_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+_TRANSITION_RE = re.compile(
+    r"\b(?:now|next|moving on|let's|another|furthermore|however"
+    r"|on the other hand|in contrast|meanwhile)\b",
+    re.IGNORECASE,
+)
+
 
 class TextProcessor:
+    # NLTK English stop words, read from the corpus once per process.
+    _english_stop_words = None
+
     def __init__(self):
-        self._download_nltk_data()
-        self.stop_words = set(stopwords.words("english"))
-        self.lemmatizer = WordNetLemmatizer()
+        # NLTK data is loaded by _ensure_ready on first use, so building a
+        # TextProcessor stays cheap for runs that never process text.
+        self._ready = False
+        self.lemmatizer = None
+        self.stop_words = None
 
         # Academic stop words to remove
         self.academic_stopwords = {
@@ -32,10 +53,29 @@ class TextProcessor:
             "today",
             "here",
         }
-        self.stop_words.update(self.academic_stopwords)
+
+    def _ensure_ready(self):
+        """Download NLTK data and build stop words on first use"""
+        if self._ready:
+            return
+
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+
+        self._download_nltk_data()
+        if TextProcessor._english_stop_words is None:
+            TextProcessor._english_stop_words = frozenset(stopwords.words("english"))
+
+        self.lemmatizer = WordNetLemmatizer()
+        self.stop_words = TextProcessor._english_stop_words.union(
+            self.academic_stopwords
+        )
+        self._ready = True
 
     def _download_nltk_data(self):
         """Download required NLTK data"""
+        import nltk
+
         try:
             nltk.data.find("tokenizers/punkt")
             nltk.data.find("corpora/stopwords")
@@ -58,6 +98,13 @@ class TextProcessor:
         """
         logger.info("Processing text...")
 
+        if len(text) < _SHORT_TEXT_CHARS:
+            return self._remove_fillers(self._clean_text(text))
+
+        from nltk.tokenize import sent_tokenize
+
+        self._ensure_ready()
+
         # Step 1: Clean and normalize text
         cleaned_text = self._clean_text(text)
 
@@ -92,7 +139,12 @@ class TextProcessor:
         """
         if not text.strip():
             return ""
+        if len(text) < _SHORT_TEXT_CHARS:
+            return self._clean_text(text)
 
+        from nltk.tokenize import sent_tokenize
+
+        self._ensure_ready()
         cleaned = self._clean_text(text)
         sentences = sent_tokenize(cleaned)
         scored = []
@@ -102,13 +154,9 @@ class TextProcessor:
             if len(normalized.split()) < 5:
                 continue
 
-            words = word_tokenize(normalized)
+            words = _WORD_RE.findall(normalized)
             content_words = [
-                w
-                for w in words
-                if w.isalpha()
-                and w not in self.stop_words
-                and w not in self.academic_stopwords
+                w for w in words if w.isalpha() and w not in self.stop_words
             ]
             if not content_words:
                 continue
@@ -138,47 +186,33 @@ class TextProcessor:
     def _clean_text(self, text):
         """Basic text cleaning"""
         # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
 
         # Fix common transcription issues
-        text = re.sub(r"\b(\w)\1{2,}\b", r"\1\1", text)  # Remove repeated letters
-        text = re.sub(r"\b[a-zA-Z]\b", "", text)  # Remove single letters
+        text = _REPEATED_CHAR_RE.sub(r"\1\1", text)  # Remove repeated letters
+        text = _SINGLE_LETTER_RE.sub("", text)  # Remove single letters
 
         # Standardize punctuation
-        text = re.sub(r"[,]{2,}", ",", text)
-        text = re.sub(r"[.]{2,}", ".", text)
+        text = _REPEATED_COMMA_RE.sub(",", text)
+        text = _REPEATED_PERIOD_RE.sub(".", text)
 
         return text.strip()
 
     def _remove_fillers(self, text):
         """Remove filler words and expressions common in lectures"""
-        filler_patterns = [
-            r"\b(um|uh|ah|er)\b",
-            r"\byou know\b",
-            r"\bI mean\b",
-            r"\bbasically\b",
-            r"\bactually\b",
-            r"\bokay so\b",
-            r"\balright so\b",
-            r"\bso um\b",
-        ]
-
-        for pattern in filler_patterns:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+        text = _FILLER_RE.sub("", text)
 
         # Clean up extra spaces
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
         return text.strip()
 
     def _process_sentence(self, sentence):
         """Process individual sentence"""
         # Skip sentences that are too repetitive or unclear
-        words = word_tokenize(sentence.lower())
+        words = _WORD_RE.findall(sentence.lower())
 
         # Remove sentences with too many stop words
-        content_words = [
-            w for w in words if w not in self.stop_words and w not in string.punctuation
-        ]
+        content_words = [w for w in words if w not in self.stop_words]
         if len(content_words) < 2:
             return None
 
@@ -193,6 +227,8 @@ class TextProcessor:
         """Group sentences into logical paragraphs"""
         if not sentences:
             return ""
+        if len(sentences) <= 4:
+            return " ".join(sentences)
 
         paragraphs = []
         current_paragraph = []
@@ -220,18 +256,4 @@ class TextProcessor:
 
     def _is_topic_transition(self, current_sentence, next_sentence):
         """Detect if there's a topic transition between sentences"""
-        transition_words = [
-            "now",
-            "next",
-            "moving on",
-            "let's",
-            "another",
-            "furthermore",
-            "however",
-            "on the other hand",
-            "in contrast",
-            "meanwhile",
-        ]
-
-        next_lower = next_sentence.lower()
-        return any(word in next_lower for word in transition_words)
+        return _TRANSITION_RE.search(next_sentence) is not None
@@ -1,85 +1,591 @@
+import asyncio
+import bisect
+import contextlib
+import functools
 import logging
 import os
+import threading
+import wave
 from pathlib import Path
 
-from pywhispercpp.model import Model
-
 logger = logging.getLogger(__name__)
 
+# Quantized ggml variants published alongside the whisper.cpp models.
+QUANTIZATIONS = ("q5_0", "q5_1", "q8_0")
+
+# "openvino" runs the whisper.cpp encoder through OpenVINO; it needs a
+# pywhispercpp build with WHISPER_OPENVINO=1 and the converted encoder model.
+# "faster-whisper" runs a CTranslate2 conversion of the model instead of
+# whisper.cpp; it is an optional dependency (`pip install faster-whisper`).
+BACKENDS = ("whispercpp", "openvino", "faster-whisper")
+OPENVINO_CACHE_DIR = os.path.expanduser("~/.cache/ov_whisper")
+
+SAMPLE_RATE = 16000
+# Whisper detects the language from a single 30-second window.
+LANGUAGE_DETECTION_SECONDS = 30
+
+
+def _audio_size(audio_path):
+    """
+    Size of an audio file, raising FileNotFoundError if it is missing.
+
+    Returns:
+        int: File size in bytes
+    """
+    try:
+        return os.stat(audio_path).st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
+
+
+def _wav_duration(audio_path):
+    """Duration in seconds from a WAV header, or None for other formats."""
+    try:
+        with wave.open(os.fspath(audio_path), "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError, ZeroDivisionError, IsADirectoryError):
+        return None
+
+
+# Formats one SRT block: index, start, end, text.
+_SRT_BLOCK = "{}\n{} --> {}\n{}\n\n".format
+
+# Serializes first loads so concurrent constructors don't load a model twice.
+_MODEL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model(backend, model_path, model_kwargs):
+    """
+    Load a model once per process and share it between Transcriber instances.
+
+    A whisper.cpp context decodes one file at a time, so each cached model
+    comes with the lock that every caller must hold while using it.
+    CTranslate2 models handle concurrent calls themselves (see num_workers).
+
+    Args:
+        backend (str): One of BACKENDS
+        model_path (str): Model name or local model path
+        model_kwargs (tuple): Sorted (name, value) pairs passed to the model
+
+    Returns:
+        tuple: (pywhispercpp Model or faster-whisper WhisperModel, lock)
+    """
+    if backend == "faster-whisper":
+        from faster_whisper import WhisperModel
+
+        return WhisperModel(model_path, **dict(model_kwargs)), contextlib.nullcontext()
+
+    from pywhispercpp.model import Model
+
+    return Model(model_path, **dict(model_kwargs)), threading.Lock()
+
 
 class Transcriber:
-    def __init__(self, model_path="base.en", models_dir=None, **model_params):
+    def __init__(
+        self,
+        model_path="base.en",
+        models_dir=None,
+        n_processors=None,
+        n_threads=None,
+        quantization=None,
+        backend="whispercpp",
+        openvino_device="CPU",
+        vad_filter=False,
+        vad_min_silence_ms=500,
+        compute_type=None,
+        **model_params,
+    ):
         """
-        Initialize whisper.cpp transcriber via pywhispercpp binding.
+        Initialize a Whisper transcriber on one of BACKENDS: whisper.cpp via
+        pywhispercpp (optionally with an OpenVINO encoder) or faster-whisper.
 
         Args:
-            model_path (str): Model name (e.g. 'base.en') or local ggml model path
+            model_path (str): Model name (e.g. 'base.en') or local model path
             models_dir (str | None): Optional model download directory
-            **model_params: Additional pywhispercpp Model parameters
+            n_processors (int | None): Split each audio file into this many
+                chunks decoded in parallel by whisper.cpp. None decodes serially.
+                whisper.cpp backends only
+            n_threads (int | None): Threads whisper.cpp uses for the mel
+                spectrogram and inference. None keeps the pywhispercpp default.
+                whisper.cpp backends only
+            quantization (str | None): Quantized weights to use for a named
+                model, one of QUANTIZATIONS (e.g. 'q8_0' loads 'base.en-q8_0').
+                whisper.cpp backends only; faster-whisper uses compute_type
+            backend (str): Inference backend, one of BACKENDS
+            openvino_device (str): OpenVINO device for the encoder (e.g. 'CPU',
+                'GPU', 'NPU'); only used by the openvino backend
+            vad_filter (bool): Drop silent stretches before transcription so
+                the model only decodes speech; timestamps are mapped back
+            vad_min_silence_ms (int): Shortest pause, in milliseconds, that
+                vad_filter cuts out; shorter gaps stay in the audio
+            compute_type (str | None): CTranslate2 compute type for the
+                faster-whisper backend. None picks float16 on GPUs with tensor
+                cores, int8_float16 on older GPUs and int8 on CPU
+            **model_params: Additional pywhispercpp Model parameters, or
+                WhisperModel parameters such as cpu_threads and num_workers
+                for the faster-whisper backend
         """
-        self.model_path = model_path
+        if quantization and quantization not in QUANTIZATIONS:
+            raise ValueError(
+                f"Unsupported quantization: {quantization}. "
+                f"Choose one of: {', '.join(QUANTIZATIONS)}"
+            )
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unsupported backend: {backend}. Choose one of: {', '.join(BACKENDS)}"
+            )
+        if backend == "faster-whisper":
+            whisper_cpp_only = {
+                "quantization": quantization,
+                "n_processors": n_processors,
+                "n_threads": n_threads,
+            }
+            unsupported = [name for name, value in whisper_cpp_only.items() if value]
+            if unsupported:
+                raise ValueError(
+                    f"{', '.join(unsupported)} only apply to whisper.cpp backends, "
+                    "not faster-whisper"
+                )
+        elif compute_type:
+            raise ValueError("compute_type only applies to the faster-whisper backend")
+
+        self.backend = backend
+        self.openvino_device = openvino_device
+        self.quantization = quantization
+        self.model_path = self._resolve_model_path(model_path)
         self.models_dir = models_dir
+        self.n_processors = n_processors
+        self.n_threads = n_threads
+        self.vad_filter = vad_filter
+        self.vad_min_silence_ms = vad_min_silence_ms
+        self.compute_type = compute_type
         self.model_params = model_params
-        self.model = self._create_model()
+        # The inference lock is shared by every Transcriber using this model.
+        self.model, self._inference_lock = self._create_model()
+        self._batched_pipeline = None
+
+    def _resolve_model_path(self, model_path):
+        """Append the quantization suffix to named models."""
+        if self.backend == "faster-whisper":
+            # CTranslate2 quantizes at load time through compute_type.
+            return model_path
+        if not self.quantization or os.path.isfile(model_path):
+            return model_path
+        if model_path.endswith(tuple(f"-{q}" for q in QUANTIZATIONS)):
+            return model_path
+        return f"{model_path}-{self.quantization}"
 
     def _create_model(self):
-        """Create pywhispercpp model instance."""
+        """Create the backend's model instance, reusing an already loaded one."""
+        if self.backend == "faster-whisper":
+            return self._create_faster_whisper_model()
+
         model_kwargs = dict(self.model_params)
         if self.models_dir:
             model_kwargs["models_dir"] = self.models_dir
+        if self.n_threads:
+            # A constructor param, so it is part of the model cache key.
+            model_kwargs["n_threads"] = self.n_threads
+        if self.backend == "openvino":
+            # The cache dir keeps the compiled encoder blob between runs.
+            model_kwargs["use_openvino"] = True
+            model_kwargs["openvino_device"] = self.openvino_device
+            model_kwargs["openvino_cache_dir"] = OPENVINO_CACHE_DIR
 
         try:
-            return Model(self.model_path, **model_kwargs)
+            with _MODEL_LOCK:
+                return _load_model(
+                    self.backend, self.model_path, tuple(sorted(model_kwargs.items()))
+                )
         except Exception as e:
             raise RuntimeError(f"Failed to initialize pywhispercpp model: {e}")
 
+    def _create_faster_whisper_model(self):
+        """Create faster-whisper model instance."""
+        try:
+            import ctranslate2
+        except ImportError:
+            raise RuntimeError(
+                "The faster-whisper backend needs the faster-whisper package"
+            )
+
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        if not self.compute_type:
+            self.compute_type = self._default_compute_type(device)
+
+        model_kwargs = dict(self.model_params)
+        model_kwargs["device"] = device
+        model_kwargs["compute_type"] = self.compute_type
+        if self.models_dir:
+            model_kwargs["download_root"] = self.models_dir
+
+        try:
+            with _MODEL_LOCK:
+                return _load_model(
+                    self.backend, self.model_path, tuple(sorted(model_kwargs.items()))
+                )
+        except Exception as e:
+            raise RuntimeError(f"Failed to initialize faster-whisper model: {e}")
+
+    @staticmethod
+    def _default_compute_type(device):
+        """Pick the fastest CTranslate2 compute type for the device."""
+        if device == "cpu":
+            return "int8"
+
+        import ctranslate2
+
+        # CTranslate2 only reports float16 on GPUs with tensor cores (SM >= 7.0).
+        if "float16" in ctranslate2.get_supported_compute_types(device):
+            return "float16"
+        return "int8_float16"
+
+    def warmup(self, seconds=1):
+        """
+        Run a short silent clip through the model.
+
+        The first inference pays one-off costs such as compiling the OpenVINO
+        encoder or initializing the GPU. Long-running callers can take that
+        hit here instead of on their first real request.
+
+        Args:
+            seconds (int): Length of the silent clip
+        """
+        import numpy as np
+
+        logger.info(f"Warming up {self.backend} model")
+        silence = np.zeros(SAMPLE_RATE * seconds, dtype=np.float32)
+        with self._inference_lock:
+            if self.backend == "faster-whisper":
+                segments, _ = self.model.transcribe(silence, beam_size=5)
+                list(segments)
+            else:
+                self.model.transcribe(
+                    silence,
+                    print_realtime=False,
+                    print_progress=False,
+                    language="auto",
+                )
+
     def transcribe_to_srt(self, audio_path, srt_path, language=None):
         """
-        Transcribe audio to SRT subtitle format using whisper.cpp
+        Transcribe audio to SRT subtitle format with the configured backend
 
         Args:
-            audio_path (str): Path to audio file
+            audio_path (str | PathLike | np.ndarray): Path to audio file, or
+                mono float32 16 kHz samples such as those from
+                AudioExtractor.extract_to_array
             srt_path (str): Path for output SRT file
             language (str): Language code (e.g., 'en', 'es'). None for auto-detect
         """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if isinstance(audio_path, (str, os.PathLike)):
+            logger.info(f"Transcribing audio file with {self.backend}: {audio_path}")
+            audio_path = self._load_audio(audio_path)
+        else:
+            logger.info(f"Transcribing in-memory audio with {self.backend}")
 
-        logger.info(f"Transcribing audio file with pywhispercpp: {audio_path}")
+        if self.backend == "faster-whisper":
+            self._transcribe_faster_whisper(audio_path, srt_path, language)
+            return
 
-        transcribe_params = {"print_realtime": False, "print_progress": False}
-        if language:
-            transcribe_params["language"] = language
+        # The model is shared and keeps the params of its last call, so the
+        # language is always set, or an earlier caller's would carry over.
+        transcribe_params = {
+            "print_realtime": False,
+            "print_progress": False,
+            "language": language or "auto",
+        }
+
+        offsets = None
+        if self.vad_filter:
+            audio_path, offsets = self._remove_silence(audio_path)
+            if not len(audio_path):
+                logger.warning("No speech detected in audio")
+                # Callers read the SRT back, so it must exist, and it must not
+                # keep subtitles from an earlier run on this path.
+                srt_output = Path(srt_path)
+                srt_output.parent.mkdir(parents=True, exist_ok=True)
+                srt_output.write_bytes(b"")
+                return
 
         try:
-            segments = self.model.transcribe(audio_path, **transcribe_params)
-            self._write_srt_from_segments(segments, srt_path)
+            with self._inference_lock:
+                segments = self.model.transcribe(
+                    audio_path, n_processors=self.n_processors, **transcribe_params
+                )
         except Exception as e:
             raise RuntimeError(f"Failed to transcribe audio with pywhispercpp: {e}")
 
+        # Write errors surface as-is rather than as transcription failures.
+        self._write_srt_from_segments(segments, srt_path, offsets)
+
+        logger.info(f"Transcription completed: {srt_path}")
+
+    def _transcribe_faster_whisper(self, audio, srt_path, language=None):
+        """Transcribe with faster-whisper, using its Silero VAD for vad_filter."""
+        try:
+            with self._inference_lock:
+                segments, _ = self.model.transcribe(
+                    audio,
+                    language=language,
+                    beam_size=5,
+                    vad_filter=self.vad_filter,
+                    vad_parameters={
+                        "min_silence_duration_ms": self.vad_min_silence_ms
+                    },
+                )
+                # Segments are decoded lazily; drain them so decoding finishes here.
+                segments = list(segments)
+        except Exception as e:
+            raise RuntimeError(f"Failed to transcribe audio with faster-whisper: {e}")
+
+        self._write_srt_from_segments(segments, srt_path)
+
+        logger.info(f"Transcription completed: {srt_path}")
+
+    def transcribe_to_srt_batched(
+        self, audio_path, srt_path, language=None, batch_size=16
+    ):
+        """
+        Transcribe VAD-cut chunks of one audio file in batches.
+
+        Uses faster-whisper's BatchedInferencePipeline, which decodes
+        `batch_size` speech chunks per encoder pass. Other backends fall back
+        to transcribe_to_srt.
+
+        Args:
+            audio_path (str | PathLike | np.ndarray): Path to audio file or
+                16 kHz samples
+            srt_path (str): Path for output SRT file
+            language (str): Language code (e.g., 'en', 'es'). None for auto-detect
+            batch_size (int): Number of chunks decoded together
+        """
+        if self.backend != "faster-whisper":
+            logger.info(f"Batched decoding needs faster-whisper, not {self.backend}")
+            self.transcribe_to_srt(audio_path, srt_path, language=language)
+            return
+
+        if isinstance(audio_path, (str, os.PathLike)):
+            audio_path = self._load_audio(audio_path)
+        logger.info(f"Transcribing with faster-whisper, batch size {batch_size}")
+
+        if self._batched_pipeline is None:
+            from faster_whisper import BatchedInferencePipeline
+
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+
+        try:
+            with self._inference_lock:
+                segments, _ = self._batched_pipeline.transcribe(
+                    audio_path,
+                    language=language,
+                    batch_size=batch_size,
+                    vad_parameters={
+                        "min_silence_duration_ms": self.vad_min_silence_ms
+                    },
+                )
+                # Chunks are decoded out of order; write them in timeline order.
+                segments = sorted(segments, key=lambda segment: segment.start)
+        except Exception as e:
+            raise RuntimeError(f"Failed to transcribe audio with faster-whisper: {e}")
+
+        self._write_srt_from_segments(segments, srt_path)
+
         logger.info(f"Transcription completed: {srt_path}")
 
-    def _write_srt_from_segments(self, segments, srt_path):
-        """Write pywhispercpp segments to SRT format."""
+    async def transcribe_to_srt_async(self, audio_path, srt_path, language=None):
+        """
+        Transcribe in a worker thread so several files can be in flight.
+
+        Decoding with ffmpeg runs concurrently with other transcriptions;
+        inference itself is serialized on whisper.cpp backends.
+
+        Args:
+            audio_path (str | PathLike | np.ndarray): Path to audio file or
+                16 kHz samples
+            srt_path (str): Path for output SRT file
+            language (str): Language code (e.g., 'en', 'es'). None for auto-detect
+
+        Returns:
+            str: Path of the written SRT file
+        """
+        if isinstance(audio_path, (str, os.PathLike)):
+            audio_path = await asyncio.to_thread(self._load_audio, audio_path)
+
+        await asyncio.to_thread(
+            self.transcribe_to_srt, audio_path, srt_path, language=language
+        )
+        return srt_path
+
+    async def transcribe_many(
+        self, audio_paths, srt_paths, language=None, max_concurrent=4
+    ):
+        """
+        Transcribe several files, at most `max_concurrent` at a time.
+
+        Returns:
+            list: SRT path, or the raised exception, for each audio file
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def transcribe(audio_path, srt_path):
+            async with semaphore:
+                return await self.transcribe_to_srt_async(
+                    audio_path, srt_path, language=language
+                )
+
+        return await asyncio.gather(
+            *(
+                transcribe(audio_path, srt_path)
+                for audio_path, srt_path in zip(audio_paths, srt_paths)
+            ),
+            return_exceptions=True,
+        )
+
+    def _load_audio(self, audio_path):
+        """
+        Decode an audio file to 16 kHz samples.
+
+        The samples are not kept once transcription is done; an hour of audio
+        is about 230 MB of float32.
+        """
+        audio_path = os.fspath(audio_path)
+        _audio_size(audio_path)
+
+        from transcription.audio_extractor import AudioExtractor
+
+        return AudioExtractor().extract_to_array(audio_path, SAMPLE_RATE)
+
+    def _remove_silence(self, audio):
+        """
+        Keep only the speech regions found by _vad.
+
+        Returns:
+            tuple: Concatenated speech samples and the (speech_ms, source_ms)
+                start lists used to map timestamps back to the source audio
+        """
+        import numpy as np
+
+        regions = self._vad(audio, min_silence_ms=self.vad_min_silence_ms)
+        speech_starts, source_starts = [], []
+        position = 0
+        for start, end in regions:
+            speech_starts.append(position * 1000 // SAMPLE_RATE)
+            source_starts.append(start * 1000 // SAMPLE_RATE)
+            position += end - start
+
+        kept = position / max(len(audio), 1)
+        logger.info(f"VAD kept {kept:.0%} of the audio as speech")
+
+        if not regions:
+            return np.zeros(0, dtype=np.float32), None
+        speech = np.concatenate([audio[start:end] for start, end in regions])
+        return speech, (speech_starts, source_starts)
+
+    def _vad(
+        self,
+        audio,
+        frame_ms=30,
+        relative_db=35.0,
+        min_silence_ms=500,
+        pad_ms=200,
+    ):
+        """
+        Energy-based voice activity detection.
+
+        A frame counts as speech when it is within `relative_db` of the loud
+        (95th percentile) frame level. Gaps shorter than `min_silence_ms` are
+        bridged and each region is padded by `pad_ms` on both sides.
+
+        Returns:
+            list[tuple[int, int]]: (start, end) sample ranges containing speech
+        """
+        import numpy as np
+
+        frame = SAMPLE_RATE * frame_ms // 1000
+        n_frames = len(audio) // frame
+        if n_frames == 0:
+            return [(0, len(audio))] if len(audio) else []
+
+        frames = audio[: n_frames * frame].reshape(n_frames, frame)
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+        level_db = 20 * np.log10(rms + 1e-10)
+        threshold = max(np.percentile(level_db, 95) - relative_db, -60.0)
+        voiced = np.concatenate(([0], (level_db > threshold).astype(np.int8), [0]))
+
+        edges = np.flatnonzero(np.diff(voiced))
+        runs = edges.reshape(-1, 2)  # [start_frame, end_frame) of each run
+
+        min_gap = min_silence_ms // frame_ms
+        pad = SAMPLE_RATE * pad_ms // 1000
+        regions = []
+        for start_frame, end_frame in runs:
+            if regions and start_frame - regions[-1][1] < min_gap:
+                regions[-1][1] = end_frame
+            else:
+                regions.append([start_frame, end_frame])
+
+        padded = []
+        for start_frame, end_frame in regions:
+            start = max(int(start_frame) * frame - pad, 0)
+            end = min(int(end_frame) * frame + pad, len(audio))
+            if padded and start <= padded[-1][1]:
+                padded[-1] = (padded[-1][0], end)
+            else:
+                padded.append((start, end))
+        return padded
+
+    def _to_source_ms(self, milliseconds, offsets, end=False):
+        """
+        Map a timestamp in VAD-filtered audio back to the source audio.
+
+        A timestamp on the boundary between two speech regions is the start
+        of the later region, or with `end` the end of the earlier one, so a
+        subtitle never spans the silence that was cut.
+        """
+        speech_starts, source_starts = offsets
+        find = bisect.bisect_left if end else bisect.bisect_right
+        index = max(find(speech_starts, milliseconds) - 1, 0)
+        return source_starts[index] + milliseconds - speech_starts[index]
+
+    def _segment_ms(self, segment):
+        """Return the (start, end) of a segment in milliseconds."""
+        if hasattr(segment, "t0"):
+            # pywhispercpp timestamps are in 10ms ticks.
+            return int(segment.t0) * 10, int(segment.t1) * 10
+        # faster-whisper timestamps are float seconds.
+        return round(segment.start * 1000), round(segment.end * 1000)
+
+    def _write_srt_from_segments(self, segments, srt_path, offsets=None):
+        """Write pywhispercpp or faster-whisper segments to SRT format."""
         srt_output = Path(srt_path)
         srt_output.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(srt_output, "w", encoding="utf-8") as f:
-            index = 1
-            for segment in segments:
-                text = getattr(segment, "text", "").strip()
-                if not text:
-                    continue
-
-                # pywhispercpp timestamps are in 10ms ticks.
-                start_ms = int(getattr(segment, "t0", 0)) * 10
-                end_ms = int(getattr(segment, "t1", 0)) * 10
-                f.write(f"{index}\n")
-                f.write(
-                    f"{self._ms_to_srt_time(start_ms)} --> {self._ms_to_srt_time(end_ms)}\n"
+        # Blocks are built in memory and written with a single call.
+        blocks = []
+        for segment in segments:
+            text = getattr(segment, "text", "").strip()
+            if not text:
+                continue
+
+            start_ms, end_ms = self._segment_ms(segment)
+            if offsets:
+                start_ms = self._to_source_ms(start_ms, offsets)
+                end_ms = self._to_source_ms(end_ms, offsets, end=True)
+            blocks.append(
+                _SRT_BLOCK(
+                    len(blocks) + 1,
+                    self._ms_to_srt_time(start_ms),
+                    self._ms_to_srt_time(end_ms),
+                    text,
                 )
-                f.write(f"{text}\n\n")
-                index += 1
+            )
+
+        with open(srt_output, "w", encoding="utf-8") as f:
+            f.write("".join(blocks))
 
     def _ms_to_srt_time(self, milliseconds):
         """Convert milliseconds to SRT time format."""
@@ -88,46 +594,116 @@ class Transcriber:
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d},{ms:03d}"
 
-    def extract_text_from_srt(self, srt_path):
-        """Extract plain text from SRT file"""
+    @staticmethod
+    def extract_text_from_srt(srt_path, generator=False):
+        """
+        Extract plain text from SRT file
+
+        Args:
+            srt_path (str): Path to SRT file
+            generator (bool): Return an iterator over the text of each
+                subtitle instead of one joined string
+
+        Returns:
+            str | Iterator[str]: Subtitle text
+        """
         if not os.path.exists(srt_path):
             raise FileNotFoundError(f"SRT file not found: {srt_path}")
 
-        text_lines = []
+        texts = Transcriber._iter_srt_text(srt_path)
+        if generator:
+            return texts
 
+        text = " ".join(texts)
+        if not text:
+            logger.warning("SRT file is empty")
+        return text
+
+    @staticmethod
+    def _iter_srt_text(srt_path):
+        """Yield the text of each subtitle block, reading one line at a time."""
         with open(srt_path, "r", encoding="utf-8") as f:
-            content = f.read()
+            state = "index"
+            lines = []
+            for line in f:
+                line = line.strip()
+                if not line:
+                    # A blank line ends the block.
+                    if lines:
+                        yield " ".join(lines)
+                        lines = []
+                    state = "index"
+                elif state == "index":
+                    state = "text" if "-->" in line else "time"
+                elif state == "time":
+                    state = "text"
+                else:
+                    lines.append(" ".join(line.split()))
 
-        if not content.strip():
-            logger.warning("SRT file is empty")
-            return ""
+            if lines:
+                yield " ".join(lines)
+
+    def detect_language(self, audio_path):
+        """
+        Detect the spoken language from the first 30 seconds of audio.
+
+        Only that window is decoded and a single encoder pass is run, instead
+        of transcribing the whole file.
 
-        # Split by double newlines to get subtitle blocks
-        blocks = content.strip().split("\n\n")
+        Args:
+            audio_path (str): Path to audio or video file
 
-        for block in blocks:
-            lines = block.strip().split("\n")
-            if len(lines) >= 3:  # Valid subtitle block
-                # Skip sequence number and timestamp, get text
-                text = "\n".join(lines[2:])
-                text_lines.append(text)
+        Returns:
+            tuple: (language code, probability)
+        """
+        _audio_size(audio_path)
+        return self._detect_language(audio_path)
 
-        return " ".join(text_lines)
+    def _detect_language(self, audio_path):
+        """detect_language for a path that has already been validated."""
+        from transcription.audio_extractor import AudioExtractor
 
-    def get_transcription_info(self, audio_path):
+        audio = AudioExtractor().extract_to_array(
+            audio_path, SAMPLE_RATE, duration=LANGUAGE_DETECTION_SECONDS
+        )
+
+        with self._inference_lock:
+            if self.backend == "faster-whisper":
+                language, probability, _ = self.model.detect_language(audio)
+            else:
+                (language, probability), _ = self.model.auto_detect_language(audio)
+        return language, probability
+
+    def get_transcription_info(self, audio_path, detect_language=False):
         """
         Get information about the transcription without full processing
 
         Args:
             audio_path (str): Path to audio file
+            detect_language (bool): Detect the language from the first 30
+                seconds of audio instead of leaving it to transcription
 
         Returns:
-            dict: Basic info about the audio and expected transcription
+            dict: Basic info about the audio and expected transcription;
+                duration is in seconds, read from the header of WAV files and
+                None for other formats
         """
+        size = _audio_size(audio_path)
+
+        language = "set during transcription"
+        if detect_language:
+            language, _ = self._detect_language(audio_path)
+
         return {
             "audio_file": audio_path,
+            "size_bytes": size,
+            "duration": _wav_duration(audio_path),
             "model_path": str(self.model_path),
             "models_dir": str(self.models_dir) if self.models_dir else None,
-            "language": "set during transcription",
-            "backend": "pywhispercpp",
+            "language": language,
+            "backend": (
+                "faster-whisper"
+                if self.backend == "faster-whisper"
+                else f"pywhispercpp ({self.backend})"
+            ),
         }
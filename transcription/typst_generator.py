@@ -1,92 +1,231 @@
+import functools
+import hashlib
 import logging
-import os
 import re
 from datetime import datetime
+from importlib import resources
+from pathlib import Path
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from transcription.cache import write_cache_file
 
 logger = logging.getLogger(__name__)
 
+# Characters with markup meaning in Typst, escaped in a single translate pass.
+# "/" covers both comments ("//") and term lists ("/ Term:").
+_TYPST_ESCAPES = str.maketrans({char: f"\\{char}" for char in "\\#$*_@<`~[]/"})
+# Heading and list markers only have meaning at the start of a line.
+_TYPST_LINE_MARKER_RE = re.compile(r"^([ \t]*)([=+-])", re.MULTILINE)
+
+
+_SYSTEM_PROMPT = (
+    "You convert lecture transcripts into polished Typst notes. "
+    "Return only valid Typst code."
+)
+_PLACEHOLDERS = ("{title}", "{date}", "{transcript}")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_template(template_filename):
+    """Read a template shipped with the package, once per process."""
+    template_path = resources.files(__package__).joinpath(template_filename)
+    return template_path.read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=4)
+def _split_prompt_template(template_filename):
+    """
+    Split a prompt template into a static system prompt and a user template.
+
+    Everything before the first line with a placeholder never changes between
+    lectures, so it is sent as a byte-identical system message. That lets the
+    server reuse its cached prefix (DeepSeek context caching, vLLM prefix
+    caching) instead of prefilling the instructions for every lecture.
+    """
+    try:
+        template = _load_template(template_filename)
+    except FileNotFoundError:
+        logger.warning(f"Prompt template not found: {template_filename}")
+        return _SYSTEM_PROMPT, ""
+
+    positions = [template.find(p) for p in _PLACEHOLDERS if p in template]
+    split_at = min(positions, default=len(template))
+    split_at = template.rfind("\n", 0, split_at) + 1
+
+    static_part = template[:split_at].strip()
+    if not static_part:
+        return _SYSTEM_PROMPT, template
+    return f"{_SYSTEM_PROMPT}\n\n{static_part}", template[split_at:]
+
 
 class TypstGenerator:
-    def __init__(self, api_key=None, model="deepseek-reasoner"):
+    def __init__(
+        self,
+        api_key=None,
+        model="deepseek-reasoner",
+        timeout=600.0,
+        max_retries=2,
+        cache_dir=None,
+    ):
         self.model = model
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.client = None
+        self.async_client = None
 
         if api_key:
-            self.client = OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
+            # Reasoning models can take minutes; a generous timeout avoids
+            # retries that would pay for the same prefill again.
+            client_kwargs = {
+                "api_key": api_key,
+                "base_url": "https://api.deepseek.com",
+                "timeout": timeout,
+                "max_retries": max_retries,
+            }
+            self.client = OpenAI(**client_kwargs)
+            self.async_client = AsyncOpenAI(**client_kwargs)
 
     def generate_notes(self, processed_text, output_path, title="Lecture Notes"):
         """Generate Typst lecture notes from processed text."""
         logger.info("Generating Typst notes...")
-        prompt = self._create_prompt(processed_text, title)
+        messages = self._create_messages(processed_text, title)
+        cache_path = self._notes_cache_path(title, processed_text)
+        if self._copy_cached_notes(cache_path, output_path):
+            return
 
         try:
             if self.client:
-                typst_content = self._generate_with_llm(prompt)
+                typst_content = self._generate_with_llm(messages)
+                self._write_notes(typst_content, output_path, cache_path)
             else:
                 logger.warning("No API key provided, generating template Typst notes")
                 typst_content = self._generate_template_notes(processed_text, title)
+                self._write_notes(typst_content, output_path)
+        except Exception as e:
+            logger.error(f"Error generating Typst notes: {e}")
+            self._write_template_notes(processed_text, title, output_path)
 
-            typst_content = self._sanitize_typst_content(typst_content)
-
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(typst_content)
+    async def agenerate_notes(
+        self, processed_text, output_path, title="Lecture Notes"
+    ):
+        """Async generate_notes, so a batch can await many LLM calls at once."""
+        logger.info("Generating Typst notes...")
+        messages = self._create_messages(processed_text, title)
+        cache_path = self._notes_cache_path(title, processed_text)
+        if self._copy_cached_notes(cache_path, output_path):
+            return
 
-            logger.info(f"Typst notes generated: {output_path}")
+        try:
+            if self.async_client:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    stream=False,
+                )
+                typst_content = self._extract_typst(response)
+                self._write_notes(typst_content, output_path, cache_path)
+            else:
+                logger.warning("No API key provided, generating template Typst notes")
+                typst_content = self._generate_template_notes(processed_text, title)
+                self._write_notes(typst_content, output_path)
         except Exception as e:
             logger.error(f"Error generating Typst notes: {e}")
-            typst_content = self._generate_template_notes(processed_text, title)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(typst_content)
+            self._write_template_notes(processed_text, title, output_path)
 
-    def _create_prompt(
-        self, text, title, template_filename="prompt_template_typst.txt"
+    def _notes_cache_path(
+        self, title, processed_text, template_filename="prompt_template_typst.txt"
     ):
-        """Create prompt from template without using str.format on Typst braces."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        template_path = os.path.join(current_dir, template_filename)
+        """
+        Cache file for LLM notes, keyed by model, both parts of the prompt
+        template, title and transcript (not the date). None when caching is
+        disabled.
+        """
+        if self.cache_dir is None:
+            return None
+
+        system_prompt, user_template = _split_prompt_template(template_filename)
+        key_source = "\0".join(
+            (self.model, system_prompt, user_template, title, processed_text)
+        )
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.typ"
+
+    def _copy_cached_notes(self, cache_path, output_path):
+        if cache_path is None or not cache_path.exists():
+            return False
 
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(cache_path.read_text(encoding="utf-8"))
+
+        logger.info(f"Typst notes reused from cache: {output_path}")
+        return True
+
+    def _write_notes(self, typst_content, output_path, cache_path=None):
+        typst_content = self._sanitize_typst_content(typst_content)
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(typst_content)
+
+        # Only LLM output is cached; template fallbacks are cheap to rebuild.
+        # An empty reply is not cached, so the next run asks the model again.
+        if cache_path is not None:
+            if typst_content.strip():
+                write_cache_file(cache_path, typst_content)
+            else:
+                logger.warning("LLM returned no content; not caching the notes")
 
+        logger.info(f"Typst notes generated: {output_path}")
+
+    def _write_template_notes(self, processed_text, title, output_path):
+        typst_content = self._generate_template_notes(processed_text, title)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(typst_content)
+
+    def _create_messages(
+        self, text, title, template_filename="prompt_template_typst.txt"
+    ):
+        """
+        Build chat messages from the prompt template.
+
+        The system message is identical for every lecture; the title, date and
+        transcript only appear in the user message so the shared prefix stays
+        cacheable on the server.
+        """
+        system_prompt, user_template = _split_prompt_template(template_filename)
         date_str = datetime.now().strftime("%B %d, %Y")
 
         # Avoid Python format parsing because Typst reference snippets often
         # contain braces that are not formatting placeholders.
-        prompt = template
+        prompt = user_template
         prompt = prompt.replace("{title}", title)
         prompt = prompt.replace("{date}", date_str)
         prompt = prompt.replace("{transcript}", text)
 
-        # If the updated template does not define placeholders, append metadata
-        # and transcript so the model still receives source content.
-        if "{transcript}" not in template:
+        # If the template does not define a transcript placeholder, append
+        # metadata and transcript so the model still receives source content.
+        if "{transcript}" not in user_template:
             prompt = (
                 f"{prompt}\n\n"
                 f"Document metadata:\n"
                 f"- Title: {title}\n"
                 f"- Date: {date_str}\n\n"
                 f"Transcript:\n{text}\n"
-            )
+            ).lstrip()
 
-        return prompt
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
 
-    def _generate_with_llm(self, prompt):
+    def _generate_with_llm(self, messages):
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You convert lecture transcripts into polished Typst notes. "
-                        "Return only valid Typst code."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=messages,
             stream=False,
         )
+        return self._extract_typst(response)
+
+    def _extract_typst(self, response):
         content = response.choices[0].message.content or ""
 
         # Normalize common fenced-code outputs to raw Typst content.
@@ -137,15 +276,11 @@ class TypstGenerator:
         self, text, title, template_filename="template_typst.typ"
     ):
         """Generate a minimal Typst document without LLM."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        template_path = os.path.join(current_dir, template_filename)
-
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
-
+        template = _load_template(template_filename)
         paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
         sections = []
         for i, para in enumerate(paragraphs[:6], 1):
+            para = self._format_paragraph_for_typst(para)
             sections.append(f"== Topic {i}\n\n{para}")
 
         body = "\n\n".join(sections) if sections else "No content available."
@@ -155,3 +290,8 @@ class TypstGenerator:
             date=datetime.now().strftime("%B %d, %Y"),
             body=body,
         )
+
+    def _format_paragraph_for_typst(self, paragraph):
+        """Escape transcript text so it renders literally in Typst markup."""
+        escaped = paragraph.translate(_TYPST_ESCAPES)
+        return _TYPST_LINE_MARKER_RE.sub(r"\1\\\2", escaped)